@@ -27,8 +27,12 @@ x(n) = True Value of Weight Which remains constant throught the Experiment
 
 """
 
+import argparse
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from plotting import show_results
 
 # Initialize the filter with an initial guess for the gold bar weight (grams)
 x_est = 1000.0  # initial guess/estimate (hat{x}_{0,0})
@@ -37,72 +41,87 @@ x_est = 1000.0  # initial guess/estimate (hat{x}_{0,0})
 true_weight = 1000.0
 
 # Given sequence of noisy measurements (grams)
-measurements = [996, 994, 1021, 1000, 1002, 1010, 983, 971, 993, 1023]
-
-# Lists to record filter estimates and (optional) predicted values
-estimates = []
-predictions = []
-
-# Loop over each measurement index (1-based) and value
-
-"""""
-enumerate(measurements, start=1):
-enumerate() gives both the index and the value at each step while looping.
-start=1 means indexing starts from 1 instead of 0, matching the mathematical notation 
-n=1,2,3,...
-n=1,2,3,... used in the PDF.
-n is the measurement number (first, second, third...).
-z is the actual measured value at that step.
-"""
-for n, z in enumerate(measurements, start=1):
-    
-    # Prediction step: for a static system, prediction = previous estimate
-    x_pred = x_est
-    predictions.append(x_pred)
-    
-    # Compute Kalman gain (alpha) for this step: alpha = 1/n
-    alpha = 1.0 / n
-    
-    # Update step (state update): combine prediction and measurement
-    # x_est = x_pred + alpha * (z - x_pred)
-    x_est = x_pred + alpha * (z - x_pred)
-    estimates.append(x_est)
+measurements = np.asarray([996, 994, 1021, 1000, 1002, 1010, 983, 971, 993, 1023], dtype=np.float64)
 
 # Prepare data for plotting: time indices starting at 1
-
-# Create a list of time steps starting from 1 up to the number of measurements.
-# This list will be used as the x-axis values in the plot.
+# Create an array of time steps starting from 1 up to the number of measurements.
+# This array will be used as the x-axis values in the plot.
 # Example: if there are 10 measurements, time_steps = [1, 2, 3, ..., 10]
-time_steps = list(range(1, len(measurements) + 1))
-
-# Print all values neatly in a table format
-# Print a header for the table
-print(f"{'Time Step':<10} {'Measured Value':<15} {'Predicted Value':<17} {'Estimated Value':<17} {'True Value':<12}")
-# Print a separator line
-print('-' * 75)
-# Loop through and print each row of data
-for n in range(len(measurements)):
-    print(f"{time_steps[n]:<10} {measurements[n]:<15} {predictions[n]:<17.2f} {estimates[n]:<17.2f} {true_weight:<12}")
-
-# Create the plot
-plt.figure(figsize=(8, 5))
-
-# Plot the true weight (constant line)
-# Create a list where the true weight value is repeated for each time step.
-# This allows plotting a constant reference line showing the true weight across all measurements.
-# Example: if true_weight = 1000 and there are 10 steps, 
-# the list will be [1000, 1000, ..., 1000] (10 times)
-plt.plot(time_steps, [true_weight]*len(time_steps), 'k--', label='True Weight')
-
-# Plot the noisy measurements
-plt.plot(time_steps, measurements, 'ro-', label='Measurements')
-
-# Plot the filter estimates
-plt.plot(time_steps, estimates, 'bs-', label='Kalman Estimate')
-plt.title('Kalman Filter: Gold Bar Weighing')
-plt.xlabel('Measurement Index (n)')
-plt.ylabel('Weight (grams)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+time_steps = np.arange(1, measurements.size + 1)
+
+
+def build_plot(plt, estimates):
+    """
+    Draw a new figure of the filter results (see plotting.show_results()).
+
+    Returns the figure and the line of the estimated values.
+    """
+    lines = {}
+
+    # Create the plot
+    fig, ax_weight = plt.subplots(figsize=(8, 5))
+
+    # Plot the true weight (constant line)
+    # Create an array where the true weight value is repeated for each time step.
+    # This allows plotting a constant reference line showing the true weight across all measurements.
+    # Example: if true_weight = 1000 and there are 10 steps, 
+    # the array will be [1000, 1000, ..., 1000] (10 times)
+    ax_weight.plot(time_steps, np.full(time_steps.size, true_weight), 'k--', label='True Weight')
+
+    # Plot the noisy measurements
+    ax_weight.plot(time_steps, measurements, 'ro-', label='Measurements')
+
+    # Plot the filter estimates
+    lines['estimates'], = ax_weight.plot(time_steps, estimates, 'bs-', label='Kalman Estimate')
+    ax_weight.set_title('Kalman Filter: Gold Bar Weighing')
+    ax_weight.set_xlabel('Measurement Index (n)')
+    ax_weight.set_ylabel('Weight (grams)')
+    ax_weight.legend()
+    ax_weight.grid(True)
+
+    return fig, lines
+
+
+def main(plot=False, save=None):
+    """Run the filter, print the results table and optionally plot or save them."""
+
+    """
+    Closed form of the state update equation:
+
+    With alpha = 1/n the recursion x'(n,n) = x'(n,n-1) + (1/n)*(z(n)-x'(n,n-1)) is
+    exactly the running mean of the measurements. At n=1 alpha = 1, so the initial
+    guess is fully replaced by z(1), and from then on
+
+    x'(n,n) = (z(1) + z(2) + ... + z(n)) / n
+
+    np.cumsum() gives the running sums and np.arange(1, N+1) gives n = 1,2,3,...
+    so all the estimates are computed at once without a Python loop.
+    """
+    estimates = np.cumsum(measurements) / np.arange(1, measurements.size + 1)
+
+    # Prediction step: for a static system, prediction = previous estimate
+    # i.e. the predictions are [x'(0,0), x'(1,1), ..., x'(N-1,N-1)]
+    predictions = np.empty(measurements.size)
+    predictions[0] = x_est
+    predictions[1:] = estimates[:-1]
+
+    # Print all values neatly in a table format
+    # Print a header for the table
+    print(f"{'Time Step':<10} {'Measured Value':<15} {'Predicted Value':<17} {'Estimated Value':<17} {'True Value':<12}")
+    # Print a separator line
+    print('-' * 75)
+    # Stack the columns side by side and print all rows with a single call
+    table = np.column_stack([time_steps, measurements, predictions, estimates,
+                             np.full(time_steps.size, true_weight)])
+    np.savetxt(sys.stdout, table, fmt='%-10d %-15.0f %-17.2f %-17.2f %-12.1f')
+
+    if plot or save:
+        show_results(build_plot, save, estimates=estimates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gold Bar Weighing using the α filter")
+    parser.add_argument("--plot", action="store_true", help="show the plots of the results")
+    parser.add_argument("--save", metavar="FILE", help="save the plots to FILE instead of showing them")
+    args = parser.parse_args()
+    main(plot=args.plot, save=args.save)
@@ -38,8 +38,13 @@ vx'(n,n-1)  = Predicted Velocity at time 'n' from time 'n-1'
 α, β        = Filter constants (gain), values depend on Radar precision
 """
 
+import argparse
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from filters import alpha_beta
+from plotting import show_results
 
 # Filter constant values for low precision radar
 alpha = 0.2
@@ -51,82 +56,77 @@ vx_est = 40        # Initial estimated velocity in m/s
 delta_t = 5        # Time interval between measurements (seconds)
 
 # Radar measurements (in meters)
-measurements = [30171, 30353, 30756, 30799, 31018, 31278, 31276, 31379, 31748, 32175]
+measurements = np.asarray([30171, 30353, 30756, 30799, 31018, 31278, 31276, 31379, 31748, 32175], dtype=np.float64)
 
-# Lists to record estimates and predictions
-x_estimates = []
-vx_estimates = []
-x_predictions = []
-vx_predictions = []
-time_steps = list(range(1, len(measurements) + 1))  # Time steps for plotting
+time_steps = np.arange(1, measurements.size + 1)  # Time steps for plotting
 
 # Compute true range values based on constant velocity motion model
 x0_true = 30000  # Initial true range (m)
 v_true = 40      # True velocity (m/s)
 
-# Generate true range at each time step
-true_ranges = []
+# Generate true range at each time step: x(n) = x0 + v * n * Δt
+true_ranges = x0_true + v_true * delta_t * time_steps
 
 
-"""
-enumerate(measurements, start=1):
-- enumerate() provides both the index and value for each radar measurement.
-- start=1 aligns with the notation n=1,2,3,... used in the example.
-- n: time step
-- z: measurement at time n
-"""
-for n, z in enumerate(measurements, start=1):
+def build_plot(plt, x_predictions, x_estimates):
+    """
+    Draw a new figure of the filter results (see plotting.show_results()).
+
+    Returns the figure and the lines of the predicted and estimated values.
+    """
+    lines = {}
+
+    # ===== Plotting the Results =====
+    fig, ax_range = plt.subplots(figsize=(10, 6))
 
-    # ==== True Value Calculations ====
-    true_range = x0_true + v_true * n * delta_t
-    true_ranges.append(true_range)
+    # Plot true range values based on initial conditions and motion model
+    ax_range.plot(time_steps, true_ranges, 'k--', label='True Range')
 
-    # ===== Prediction Step using State Extrapolation Equations =====
-    x_pred = x_est + delta_t * vx_est  # Predicted range based on previous state
-    vx_pred = vx_est                   # Predicted velocity remains constant
+    # Plot measured values (radar readings)
+    ax_range.plot(time_steps, measurements, 'ro-', label='Measured Range')
 
-    # Save predicted values
-    x_predictions.append(x_pred)
-    vx_predictions.append(vx_pred)
+    # Plot predicted positions (based on model)
+    lines['x_predictions'], = ax_range.plot(time_steps, x_predictions, 'g^-', label='Predicted Range')
 
-    # ===== Update Step using α−β Filter Equations =====
-    residual = z - x_pred  # Innovation: difference between measurement and prediction
+    # Plot estimated positions (after Kalman correction)
+    lines['x_estimates'], = ax_range.plot(time_steps, x_estimates, 'bs-', label='Estimated Range')
 
-    # Update estimated range using α gain
-    x_est = x_pred + alpha * residual
+    ax_range.set_title('α–β Filter Tracking of Constant Velocity Aircraft')
+    ax_range.set_xlabel('Time Step (n)')
+    ax_range.set_ylabel('Range (meters)')
+    ax_range.legend()
+    ax_range.grid(True)
 
-    # Update estimated velocity using β gain
-    vx_est = vx_pred + (beta * residual / delta_t)
+    return fig, lines
 
-    # Save current estimates
-    x_estimates.append(x_est)
-    vx_estimates.append(vx_est)
 
-# ===== Print All Values in Tabular Format =====
-print(f"{'Time Step':<10} {'Measured':<10} {'Predicted':<12} {'Estimated':<12} {'Est. Velocity':<15}")
-print('-' * 65)
-for i in range(len(measurements)):
-    print(f"{time_steps[i]:<10} {measurements[i]:<10} {x_predictions[i]:<12.2f} {x_estimates[i]:<12.2f} {vx_estimates[i]:<15.2f}")
+def main(plot=False, alpha=alpha, beta=beta, save=None):
+    """
+    Run the filter, print the results table and optionally plot them (or save the
+    plots to the file save).
 
-# ===== Plotting the Results =====
-plt.figure(figsize=(10, 6))
+    The gains default to the ones of the example and can be overridden to try others.
+    """
 
-# Plot true range values based on initial conditions and motion model
-plt.plot(time_steps, true_ranges, 'k--', label='True Range')
+    # ===== Run the α−β Filter (Prediction + Update for every measurement) =====
+    # There is only one radar track, so it is passed as a (1, N) batch of streams
+    # and the first (and only) row of every result is kept
+    filter_outputs = alpha_beta(measurements[np.newaxis, :], alpha, beta, delta_t, x_est, vx_est)
+    x_predictions, x_estimates, vx_predictions, vx_estimates = (out[0] for out in filter_outputs)
 
-# Plot measured values (radar readings)
-plt.plot(time_steps, measurements, 'ro-', label='Measured Range')
+    # ===== Print All Values in Tabular Format =====
+    print(f"{'Time Step':<10} {'Measured':<10} {'Predicted':<12} {'Estimated':<12} {'Est. Velocity':<15}")
+    print('-' * 65)
+    table = np.column_stack([time_steps, measurements, x_predictions, x_estimates, vx_estimates])
+    np.savetxt(sys.stdout, table, fmt='%-10d %-10.0f %-12.2f %-12.2f %-15.2f')
 
-# Plot predicted positions (based on model)
-plt.plot(time_steps, x_predictions, 'g^-', label='Predicted Range')
+    if plot or save:
+        show_results(build_plot, save, x_predictions=x_predictions, x_estimates=x_estimates)
 
-# Plot estimated positions (after Kalman correction)
-plt.plot(time_steps, x_estimates, 'bs-', label='Estimated Range')
 
-plt.title('α–β Filter Tracking of Constant Velocity Aircraft')
-plt.xlabel('Time Step (n)')
-plt.ylabel('Range (meters)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="α–β Filter Tracking of Constant Velocity Aircraft")
+    parser.add_argument("--plot", action="store_true", help="show the plots of the results")
+    parser.add_argument("--save", metavar="FILE", help="save the plots to FILE instead of showing them")
+    args = parser.parse_args()
+    main(plot=args.plot, save=args.save)
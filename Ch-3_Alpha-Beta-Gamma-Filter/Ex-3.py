@@ -34,8 +34,13 @@ vx'(n,n-1)  = Predicted Velocity at time 'n' from time 'n-1'
 α, β        = Filter constants (gain), values depend on Radar precision
 """
 
+import argparse
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from filters import alpha_beta
+from plotting import show_results
 
 # Filter constants for imprecise radar
 alpha = 0.2
@@ -47,104 +52,95 @@ vx_est = 50       # Initial estimated velocity (m/s)
 delta_t = 5       # Track-to-track interval in seconds
 
 # Measured radar range values (m)
-measurements = [30221, 30453, 30906, 30999, 31368, 31978, 32526, 33379, 34698, 36275]
+measurements = np.asarray([30221, 30453, 30906, 30999, 31368, 31978, 32526, 33379, 34698, 36275], dtype=np.float64)
 
-# Lists to store results
-x_estimates = []
-vx_estimates = []
-x_predictions = []
-vx_predictions = []
-true_ranges = []
-true_velocities = []
-time_steps = list(range(1, len(measurements) + 1))
+time_steps = np.arange(1, measurements.size + 1)
 
 # True motion model parameters
 x0_true = 30000  # Initial true position (m)
 v0_true = 50     # Initial velocity (m/s)
 a_true = 8       # Acceleration (m/s²)
 
+# ===== True Value Calculations =====
 """
-enumerate(measurements, start=1):
-- enumerate() provides both index and value.
-- n: index starting from 1 (1st measurement).
-- z: measured radar value at time step n.
+Instead of checking 'total_time <= 20' at every step, the whole true trajectory is
+computed at once. t_accel is the time spent accelerating, which is 0 during the
+constant velocity phase, so the acceleration terms simply vanish before 20 seconds:
+
+x(t)  = x0 + v0 * t + 0.5 * a * t_accel²
+vx(t) = v0 + a * t_accel
 """
-for n, z in enumerate(measurements, start=1):
-
-    # ===== True Value Calculations =====
-    total_time = n * delta_t
-    if total_time <= 20:
-        # Constant velocity phase
-        true_range = x0_true + v0_true * total_time
-        true_velocity = v0_true
-    else:
-        # Accelerated phase
-        t_accel = total_time - 20
-        true_range = x0_true + v0_true * 20 + v0_true * t_accel + 0.5 * a_true * t_accel ** 2
-        true_velocity = v0_true + a_true * t_accel
-
-    true_ranges.append(true_range)
-    true_velocities.append(true_velocity)
-
-    # ===== Prediction Step =====
-    x_pred = x_est + delta_t * vx_est     # Predicted range
-    vx_pred = vx_est                      # Predicted velocity remains unchanged
-    x_predictions.append(x_pred)
-    vx_predictions.append(vx_pred)
-
-    # ===== Update Step =====
-    residual = z - x_pred                 # Innovation (difference between measurement and prediction)
-    x_est = x_pred + alpha * residual     # Update range
-    vx_est = vx_pred + (beta * residual / delta_t)  # Update velocity
-    x_estimates.append(x_est)
-    vx_estimates.append(vx_est)
-
-# ===== Print Tabular Output =====
-print(f"{'Time Step':<10} {'Measured':<10} {'Predicted':<12} {'Estimated':<12} {'True':<10} {'Est. Velocity':<15} {'True Velocity':<15}")
-print('-' * 90)
-for i in range(len(measurements)):
-    print(f"{time_steps[i]:<10} {measurements[i]:<10} {x_predictions[i]:<12.2f} {x_estimates[i]:<12.2f} "
-          f"{true_ranges[i]:<10.2f} {vx_estimates[i]:<15.2f} {true_velocities[i]:<15.2f}")
-
-# ===== Plotting =====
-plt.figure(figsize=(10, 6))
-
-# Plot true range
-plt.plot(time_steps, true_ranges, 'k--', label='True Range')
-
-# Plot measured values
-plt.plot(time_steps, measurements, 'ro-', label='Measured Range')
-
-# Plot predicted range
-plt.plot(time_steps, x_predictions, 'g^-', label='Predicted Range')
-
-# Plot estimated range
-plt.plot(time_steps, x_estimates, 'bs-', label='Estimated Range')
-
-plt.title('α–β Filter Tracking of Accelerating Aircraft')
-plt.xlabel('Time Step (n)')
-plt.ylabel('Range (meters)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# ===== Optional: Velocity Plot =====
-plt.figure(figsize=(10, 6))
-
-# Plot true velocity
-plt.plot(time_steps, true_velocities, 'k--', label='True Velocity')
-
-# Plot predicted velocity
-plt.plot(time_steps, vx_predictions, 'g^-', label='Predicted Velocity')
-
-# Plot estimated velocity
-plt.plot(time_steps, vx_estimates, 'bs-', label='Estimated Velocity')
-
-plt.title('α–β Filter Velocity Tracking of Accelerating Aircraft')
-plt.xlabel('Time Step (n)')
-plt.ylabel('Velocity (m/s)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+time_arr = time_steps * delta_t
+t_accel = np.maximum(time_arr - 20.0, 0.0)
+true_ranges = x0_true + v0_true * time_arr + 0.5 * a_true * t_accel ** 2
+true_velocities = v0_true + a_true * t_accel
+
+
+def build_plot(plt, x_predictions, x_estimates, vx_predictions, vx_estimates):
+    """
+    Draw a new figure of the filter results (see plotting.show_results()).
+
+    Returns the figure and the lines of the predicted and estimated values.
+    """
+    lines = {}
+
+    # ===== Plotting =====
+    # One figure with the range and velocity panels sharing the time axis
+    fig, (ax_range, ax_vel) = plt.subplots(2, 1, sharex=True, figsize=(10, 10))
+
+    # Plot true, measured, predicted and estimated range
+    ax_range.plot(time_steps, true_ranges, 'k--', label='True Range')
+    ax_range.plot(time_steps, measurements, 'ro-', label='Measured Range')
+    lines['x_predictions'], = ax_range.plot(time_steps, x_predictions, 'g^-', label='Predicted Range')
+    lines['x_estimates'], = ax_range.plot(time_steps, x_estimates, 'bs-', label='Estimated Range')
+    ax_range.set_title('α–β Filter Tracking of Accelerating Aircraft')
+    ax_range.set_ylabel('Range (meters)')
+    ax_range.legend()
+    ax_range.grid(True)
+
+    # Plot true, predicted and estimated velocity
+    ax_vel.plot(time_steps, true_velocities, 'k--', label='True Velocity')
+    lines['vx_predictions'], = ax_vel.plot(time_steps, vx_predictions, 'g^-', label='Predicted Velocity')
+    lines['vx_estimates'], = ax_vel.plot(time_steps, vx_estimates, 'bs-', label='Estimated Velocity')
+    ax_vel.set_title('α–β Filter Velocity Tracking of Accelerating Aircraft')
+    ax_vel.set_xlabel('Time Step (n)')
+    ax_vel.set_ylabel('Velocity (m/s)')
+    ax_vel.legend()
+    ax_vel.grid(True)
+
+    return fig, lines
+
+
+def main(plot=False, alpha=alpha, beta=beta, save=None):
+    """
+    Run the filter, print the results table and optionally plot them (or save the
+    plots to the file save).
+
+    The gains default to the ones of the example and can be overridden to try others.
+    """
+
+    # ===== Run the α−β Filter (Prediction + Update for every measurement) =====
+    # There is only one radar track, so it is passed as a (1, N) batch of streams
+    # and the first (and only) row of every result is kept
+    filter_outputs = alpha_beta(measurements[np.newaxis, :], alpha, beta, delta_t, x_est, vx_est)
+    x_predictions, x_estimates, vx_predictions, vx_estimates = (out[0] for out in filter_outputs)
+
+    # ===== Print Tabular Output =====
+    print(f"{'Time Step':<10} {'Measured':<10} {'Predicted':<12} {'Estimated':<12} {'True':<10} {'Est. Velocity':<15} {'True Velocity':<15}")
+    print('-' * 90)
+    table = np.column_stack([time_steps, measurements, x_predictions, x_estimates,
+                             true_ranges, vx_estimates, true_velocities])
+    np.savetxt(sys.stdout, table, fmt='%-10d %-10.0f %-12.2f %-12.2f %-10.2f %-15.2f %-15.2f')
+
+    if plot or save:
+        show_results(build_plot, save,
+                     x_predictions=x_predictions, x_estimates=x_estimates,
+                     vx_predictions=vx_predictions, vx_estimates=vx_estimates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="α–β Filter Tracking of Accelerating Aircraft")
+    parser.add_argument("--plot", action="store_true", help="show the plots of the results")
+    parser.add_argument("--save", metavar="FILE", help="save the plots to FILE instead of showing them")
+    args = parser.parse_args()
+    main(plot=args.plot, save=args.save)
@@ -50,11 +50,29 @@ z(n)        = Measured Range using radar at time 'n'
               β = 0.4 (velocity gain)
               γ = 0.1 (acceleration gain)
               Δt = 5 seconds
+
+The prediction equations are one fixed matrix multiply and the update equations add a
+fixed gain vector times the residual, which is the state-space form of the filter:
+
+s'(n+1,n)   = F * s'(n,n)
+s'(n,n)     = s'(n,n-1) + K * ( z(n) - H * s'(n,n-1) )
+
+with s = [ x, vx, ax ], F = [ [1, Δt, 0.5*Δt²], [0, 1, Δt], [0, 0, 1] ],
+K = [ α, β/Δt, γ/(0.5*Δt²) ] and H = [ 1, 0, 0 ].
+
+This example still runs the scalar equations above, through the compiled
+filters.alpha_beta_gamma() kernel: they give the same results, while running the matrix
+form with NumPy pays for several calls on tiny arrays at every step.
 """
 
 
+import argparse
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from filters import alpha_beta_gamma
+from plotting import show_results
 
 # Filter constants
 alpha = 0.5
@@ -68,115 +86,117 @@ vx_est = 50       # Initial velocity estimate (m/s)
 ax_est = 0        # Initial acceleration estimate (m/s²)
 
 # Radar measurements (in meters)
-measurements = [30221, 30453, 30906, 30999, 31368, 31978, 32526, 33379, 34698, 36275]
-
-# Initialize lists to store filter values
-x_estimates = []
-vx_estimates = []
-ax_estimates = []
-x_predictions = []
-vx_predictions = []
-ax_predictions = []
-true_ranges = []
-true_velocities = []
-true_accelerations = []
-time_steps = list(range(1, len(measurements) + 1))
+measurements = np.asarray([30221, 30453, 30906, 30999, 31368, 31978, 32526, 33379, 34698, 36275], dtype=np.float64)
+
+time_steps = np.arange(1, measurements.size + 1)
 
 # True motion model parameters
 x0_true = 30000
 v0_true = 50
 a_true = 8
 
+# ====== TRUE STATE CALCULATION ======
 """
-Loop over each measurement:
-- Generate true position, velocity, acceleration
-- Predict next state using extrapolation equations
-- Update state using measurement with correction equations
+The true trajectory is computed at once instead of inside the filter loop. t_accel is
+the time spent accelerating, which is 0 for the first 20 seconds, so the acceleration
+terms vanish during the constant velocity phase:
+
+x(t)  = x0 + v0 * t + 0.5 * a * t_accel²
+vx(t) = v0 + a * t_accel
+ax(t) = a (only after 20 seconds)
 """
-for n, z in enumerate(measurements, start=1):
-
-    # ====== TRUE STATE CALCULATION ======
-    total_time = n * delta_t
-    if total_time <= 20:
-        true_range = x0_true + v0_true * total_time
-        true_velocity = v0_true
-        true_accel = 0
-    else:
-        t_accel = total_time - 20
-        true_range = x0_true + v0_true * 20 + v0_true * t_accel + 0.5 * a_true * t_accel ** 2
-        true_velocity = v0_true + a_true * t_accel
-        true_accel = a_true
-
-    true_ranges.append(true_range)
-    true_velocities.append(true_velocity)
-    true_accelerations.append(true_accel)
-
-    # ====== PREDICTION STEP ======
-    x_pred = x_est + delta_t * vx_est + 0.5 * ax_est * delta_t ** 2
-    vx_pred = vx_est + ax_est * delta_t
-    ax_pred = ax_est
-
-    # Store predicted values
-    x_predictions.append(x_pred)
-    vx_predictions.append(vx_pred)
-    ax_predictions.append(ax_pred)
-
-    # ====== UPDATE STEP ======
-    residual = z - x_pred
-    x_est = x_pred + alpha * residual
-    vx_est = vx_pred + beta * (residual / delta_t)
-    ax_est = ax_pred + gamma * (residual / (0.5 * delta_t ** 2))
-
-    # Store updated estimates
-    x_estimates.append(x_est)
-    vx_estimates.append(vx_est)
-    ax_estimates.append(ax_est)
-
-# ===== PRINT TABULATED OUTPUT =====
-print(f"{'Time Step':<10} {'Measured':<10} {'Predicted':<12} {'Estimated':<12} {'True':<10} {'Est. Vel.':<12} {'True Vel.':<12} {'Est. Acc.':<12} {'True Acc.':<10}")
-print('-' * 110)
-for i in range(len(measurements)):
-    print(f"{time_steps[i]:<10} {measurements[i]:<10} {x_predictions[i]:<12.2f} {x_estimates[i]:<12.2f} "
-          f"{true_ranges[i]:<10.2f} {vx_estimates[i]:<12.2f} {true_velocities[i]:<12.2f} {ax_estimates[i]:<12.2f} {true_accelerations[i]:<10.2f}")
-
-# ===== PLOTTING =====
-
-# Plot range
-plt.figure(figsize=(10, 6))
-plt.plot(time_steps, true_ranges, 'k--', label='True Range')
-plt.plot(time_steps, measurements, 'ro-', label='Measured Range')
-plt.plot(time_steps, x_predictions, 'g^-', label='Predicted Range')
-plt.plot(time_steps, x_estimates, 'bs-', label='Estimated Range')
-plt.title('α–β–γ Filter: Range Tracking')
-plt.xlabel('Time Step (n)')
-plt.ylabel('Range (meters)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# Plot velocity
-plt.figure(figsize=(10, 6))
-plt.plot(time_steps, true_velocities, 'k--', label='True Velocity')
-plt.plot(time_steps, vx_predictions, 'g^-', label='Predicted Velocity')
-plt.plot(time_steps, vx_estimates, 'bs-', label='Estimated Velocity')
-plt.title('α–β–γ Filter: Velocity Tracking')
-plt.xlabel('Time Step (n)')
-plt.ylabel('Velocity (m/s)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
-
-# Plot acceleration
-plt.figure(figsize=(10, 6))
-plt.plot(time_steps, true_accelerations, 'k--', label='True Acceleration')
-plt.plot(time_steps, ax_predictions, 'g^-', label='Predicted Acceleration')
-plt.plot(time_steps, ax_estimates, 'bs-', label='Estimated Acceleration')
-plt.title('α–β–γ Filter: Acceleration Tracking')
-plt.xlabel('Time Step (n)')
-plt.ylabel('Acceleration (m/s²)')
-plt.legend()
-plt.grid(True)
-plt.tight_layout()
-plt.show()
+time_arr = time_steps * delta_t
+t_accel = np.maximum(time_arr - 20.0, 0.0)
+true_ranges = x0_true + v0_true * time_arr + 0.5 * a_true * t_accel ** 2
+true_velocities = v0_true + a_true * t_accel
+true_accelerations = a_true * (time_arr > 20.0)
+
+
+def build_plot(plt, x_predictions, x_estimates, vx_predictions, vx_estimates,
+               ax_predictions, ax_estimates):
+    """
+    Draw a new figure of the filter results (see plotting.show_results()).
+
+    Returns the figure and the lines of the predicted and estimated values.
+    """
+    lines = {}
+
+    # ===== PLOTTING =====
+    # One figure with range, velocity and acceleration panels sharing the time axis
+    fig, (ax_range, ax_vel, ax_acc) = plt.subplots(3, 1, sharex=True, figsize=(10, 12))
+
+    # Plot range
+    ax_range.plot(time_steps, true_ranges, 'k--', label='True Range')
+    ax_range.plot(time_steps, measurements, 'ro-', label='Measured Range')
+    lines['x_predictions'], = ax_range.plot(time_steps, x_predictions, 'g^-', label='Predicted Range')
+    lines['x_estimates'], = ax_range.plot(time_steps, x_estimates, 'bs-', label='Estimated Range')
+    ax_range.set_title('α–β–γ Filter: Range Tracking')
+    ax_range.set_ylabel('Range (meters)')
+    ax_range.legend()
+    ax_range.grid(True)
+
+    # Plot velocity
+    ax_vel.plot(time_steps, true_velocities, 'k--', label='True Velocity')
+    lines['vx_predictions'], = ax_vel.plot(time_steps, vx_predictions, 'g^-', label='Predicted Velocity')
+    lines['vx_estimates'], = ax_vel.plot(time_steps, vx_estimates, 'bs-', label='Estimated Velocity')
+    ax_vel.set_title('α–β–γ Filter: Velocity Tracking')
+    ax_vel.set_ylabel('Velocity (m/s)')
+    ax_vel.legend()
+    ax_vel.grid(True)
+
+    # Plot acceleration
+    ax_acc.plot(time_steps, true_accelerations, 'k--', label='True Acceleration')
+    lines['ax_predictions'], = ax_acc.plot(time_steps, ax_predictions, 'g^-', label='Predicted Acceleration')
+    lines['ax_estimates'], = ax_acc.plot(time_steps, ax_estimates, 'bs-', label='Estimated Acceleration')
+    ax_acc.set_title('α–β–γ Filter: Acceleration Tracking')
+    ax_acc.set_xlabel('Time Step (n)')
+    ax_acc.set_ylabel('Acceleration (m/s²)')
+    ax_acc.legend()
+    ax_acc.grid(True)
+
+    return fig, lines
+
+
+def main(plot=False, alpha=alpha, beta=beta, gamma=gamma, save=None):
+    """
+    Run the filter, print the results table and optionally plot them (or save the
+    plots to the file save).
+
+    The gains default to the ones of the example and can be overridden to try others.
+    """
+
+    # ====== FILTER ======
+    """
+    Run the filter over all measurements with a single call:
+    - Predict next state using extrapolation equations
+    - Update state using measurement with correction equations
+
+    Here there is only one radar track, so it is passed as a (1, N) batch of streams and
+    the first (and only) row of every result is kept.
+    """
+    filter_outputs = alpha_beta_gamma(measurements[np.newaxis, :], alpha, beta, gamma, delta_t,
+                                      x_est, vx_est, ax_est)
+    x_predictions, x_estimates, vx_predictions, vx_estimates, ax_predictions, ax_estimates = (
+        out[0] for out in filter_outputs)
+
+    # ===== PRINT TABULATED OUTPUT =====
+    print(f"{'Time Step':<10} {'Measured':<10} {'Predicted':<12} {'Estimated':<12} {'True':<10} {'Est. Vel.':<12} {'True Vel.':<12} {'Est. Acc.':<12} {'True Acc.':<10}")
+    print('-' * 110)
+    table = np.column_stack([time_steps, measurements, x_predictions, x_estimates, true_ranges,
+                             vx_estimates, true_velocities, ax_estimates, true_accelerations])
+    np.savetxt(sys.stdout, table,
+               fmt='%-10d %-10.0f %-12.2f %-12.2f %-10.2f %-12.2f %-12.2f %-12.2f %-10.2f')
+
+    if plot or save:
+        show_results(build_plot, save,
+                     x_predictions=x_predictions, x_estimates=x_estimates,
+                     vx_predictions=vx_predictions, vx_estimates=vx_estimates,
+                     ax_predictions=ax_predictions, ax_estimates=ax_estimates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="α–β–γ Filter Tracking of Accelerating Aircraft")
+    parser.add_argument("--plot", action="store_true", help="show the plots of the results")
+    parser.add_argument("--save", metavar="FILE", help="save the plots to FILE instead of showing them")
+    args = parser.parse_args()
+    main(plot=args.plot, save=args.save)
@@ -0,0 +1,69 @@
+"""
+α–β and α–β–γ filter kernels shared by the Chapter 3 examples.
+
+The first kernels that can be imported are used, in this order:
+
+1. abg_native - ahead-of-time compiled by Numba (see build_native.py)
+2. abg_cy     - compiled by Cython (see abg_cy.pyx)
+3. abg        - compiled by Numba at run time
+4. abg_py     - pure Python, when none of the above is available
+
+The native kernels do not check their arguments, so they are only handed C-contiguous
+2-D float64 batches; batches of other dtypes (e.g. float32) go to the next kernels.
+"""
+
+import importlib
+
+import numpy as np
+
+_BACKENDS = ('abg_native', 'abg_cy', 'abg', 'abg_py')
+
+
+def _import_first(names):
+    """Import and return the first of the kernel modules names that can be imported."""
+    for name in names:
+        try:
+            return importlib.import_module('.' + name, __name__)
+        except ImportError:
+            continue
+    raise ImportError("none of the filter kernels " + ", ".join(names) + " can be imported")
+
+
+# Kernels for the batches the native ones were not compiled for, imported on first use
+# (importing them loads Numba, which the native kernels are built to avoid)
+_fallback_kernels = None
+
+
+def _fallback():
+    """Import the fallback kernel module the first time it is needed and return it."""
+    global _fallback_kernels
+    if _fallback_kernels is None:
+        _fallback_kernels = _import_first(_BACKENDS[1:])
+    return _fallback_kernels
+
+
+def _checked_native(name):
+    """Wrap the native kernel name so it only gets input it was compiled for."""
+    native = getattr(_kernels, name)
+
+    def kernel(z, *params):
+        z = np.asarray(z)
+        if z.ndim != 2:
+            raise TypeError(f"{name}() expects an (S, N) batch of measurement streams, "
+                            f"got a {z.ndim}-D array")
+        if z.dtype != np.float64:
+            return getattr(_fallback(), name)(z, *params)
+        return native(np.ascontiguousarray(z), *(float(p) for p in params))
+
+    kernel.__name__ = kernel.__qualname__ = name
+    return kernel
+
+
+_kernels = _import_first(_BACKENDS)
+
+if _kernels.__name__.endswith('.abg_native'):
+    alpha_beta = _checked_native('alpha_beta')
+    alpha_beta_gamma = _checked_native('alpha_beta_gamma')
+else:
+    alpha_beta = _kernels.alpha_beta
+    alpha_beta_gamma = _kernels.alpha_beta_gamma
@@ -0,0 +1,151 @@
+"""
+α–β and α–β–γ Filter Kernels shared by the Chapter 3 examples
+
+Ex-2 and Ex-3 (α–β filter) and Ex-4 (α–β–γ filter) all run the same recursion, only the
+measurements, the initial guess and the filter constants change. So the recursions live
+here once and the example scripts only prepare the data, call the kernel and print/plot
+the results.
+
+For the α–β filter the prediction and update equations combine into a fixed 2x2 linear
+state update:
+
+s(n) = A * s(n-1) + b * z(n)
+
+where,
+
+s(n) = [ x'(n,n), vx'(n,n) ]
+
+A    = [ [ 1-α,    (1-α)*Δt ],
+         [ -β/Δt,  1-β      ] ]
+
+b    = [ α, β/Δt ]
+
+Since every step depends on the previous one, the loop itself cannot be removed. Instead
+the gains are combined with Δt once before the loop, only scalar float locals are used
+inside it and the results are written into preallocated arrays, so Numba can turn the
+whole loop into plain machine code.
+
+Both kernels take z as an array of shape (S, N): S independent measurement streams
+(e.g. Monte Carlo runs or several targets) of N measurements each. The streams do not
+depend on each other, so they are spread over all CPU cores with prange(). The kernels
+are compiled for float32 and float64 measurements and return arrays of the same dtype.
+With float32 the whole recursion stays in float32, which halves the memory traffic of
+large batches and doubles the number of values per SIMD register.
+
+The compiled code is cached on disk (cache=True), and build_native.py can compile the
+float64 kernels ahead of time so the scripts do not pay the JIT warm-up at all. This module
+needs Numba; without it the 'filters' package falls back to the pure-Python kernels in
+abg_py.py.
+"""
+
+import numpy as np
+
+from numba import njit, prange, float32, float64, types
+
+AB_SIGNATURES = [types.UniTuple(t[:, :], 4)(t[:, :], t, t, t, t, t)
+                 for t in (float32, float64)]
+ABG_SIGNATURES = [types.UniTuple(t[:, :], 6)(t[:, :], t, t, t, t, t, t, t)
+                  for t in (float32, float64)]
+
+
+@njit(AB_SIGNATURES, cache=True, parallel=True)
+def alpha_beta(z, alpha, beta, dt, x0, v0):
+    """
+    Run the α–β filter over a batch of measurement streams.
+
+    z      = Measured range z(n), array of shape (S, N)
+    alpha  = Range gain α
+    beta   = Velocity gain β
+    dt     = Track-to-track interval Δt
+    x0, v0 = Initial range and velocity estimates x'(0,0), vx'(0,0)
+
+    Returns (x_pred, x_est, vx_pred, vx_est) arrays of shape (S, N).
+    """
+    S, N = z.shape
+    x_pred_out = np.empty((S, N), z.dtype)
+    x_out = np.empty((S, N), z.dtype)
+    v_pred_out = np.empty((S, N), z.dtype)
+    v_out = np.empty((S, N), z.dtype)
+
+    # Loop-invariant constant β/Δt
+    beta_over_dt = beta / dt
+
+    for s in prange(S):
+
+        x_est = x0
+        vx_est = v0
+
+        for n in range(N):
+
+            # ===== Prediction Step =====
+            x_pred = x_est + dt * vx_est
+            vx_pred = vx_est
+
+            # ===== Update Step =====
+            residual = z[s, n] - x_pred
+            x_est = x_pred + alpha * residual
+            vx_est = vx_pred + beta_over_dt * residual
+
+            x_pred_out[s, n] = x_pred
+            x_out[s, n] = x_est
+            v_pred_out[s, n] = vx_pred
+            v_out[s, n] = vx_est
+
+    return x_pred_out, x_out, v_pred_out, v_out
+
+
+@njit(ABG_SIGNATURES, cache=True, parallel=True)
+def alpha_beta_gamma(z, alpha, beta, gamma, dt, x0, v0, a0):
+    """
+    Run the α–β–γ filter over a batch of measurement streams.
+
+    z          = Measured range z(n), array of shape (S, N)
+    alpha      = Range gain α
+    beta       = Velocity gain β
+    gamma      = Acceleration gain γ
+    dt         = Track-to-track interval Δt
+    x0, v0, a0 = Initial range, velocity and acceleration estimates
+
+    Returns (x_pred, x_est, vx_pred, vx_est, ax_pred, ax_est) arrays of shape (S, N).
+    """
+    S, N = z.shape
+    x_pred_out = np.empty((S, N), z.dtype)
+    x_out = np.empty((S, N), z.dtype)
+    v_pred_out = np.empty((S, N), z.dtype)
+    v_out = np.empty((S, N), z.dtype)
+    a_pred_out = np.empty((S, N), z.dtype)
+    a_out = np.empty((S, N), z.dtype)
+
+    # Loop-invariant constants: 0.5*Δt², β/Δt and γ/(0.5*Δt²)
+    # (0.5 is written as a float32 so it does not promote float32 inputs to float64)
+    half_dt2 = np.float32(0.5) * dt * dt
+    beta_over_dt = beta / dt
+    gamma_over_half_dt2 = gamma / half_dt2
+
+    for s in prange(S):
+
+        x_est = x0
+        vx_est = v0
+        ax_est = a0
+
+        for n in range(N):
+
+            # ====== PREDICTION STEP ======
+            x_pred = x_est + dt * vx_est + half_dt2 * ax_est
+            vx_pred = vx_est + dt * ax_est
+            ax_pred = ax_est
+
+            # ====== UPDATE STEP ======
+            residual = z[s, n] - x_pred
+            x_est = x_pred + alpha * residual
+            vx_est = vx_pred + beta_over_dt * residual
+            ax_est = ax_pred + gamma_over_half_dt2 * residual
+
+            x_pred_out[s, n] = x_pred
+            x_out[s, n] = x_est
+            v_pred_out[s, n] = vx_pred
+            v_out[s, n] = vx_est
+            a_pred_out[s, n] = ax_pred
+            a_out[s, n] = ax_est
+
+    return x_pred_out, x_out, v_pred_out, v_out, a_pred_out, a_out
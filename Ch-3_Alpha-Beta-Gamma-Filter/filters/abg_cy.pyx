@@ -0,0 +1,128 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Cython Version of the α–β and α–β–γ Filter Kernels
+
+Same recursions as the Numba kernels in abg.py, but compiled once to a C extension, so
+there is neither a Numba dependency nor a JIT warm-up at run time. The measurements are
+read through typed memoryviews and the loop only uses C doubles/floats, so the compiled
+loop never touches the Python interpreter. The memoryviews accept any strides, so slices
+of a larger batch (e.g. z[:, ::2] or z.T) are filtered without being copied first.
+
+'floating' is a Cython fused type: every function is compiled once for float32 and once
+for float64 measurements, and the results have the same dtype as z.
+
+Build it from the Ch-3 folder with (requires Cython and a C compiler):
+
+    python setup.py build_ext --inplace
+"""
+
+import numpy as np
+
+from cython cimport floating
+
+
+def alpha_beta(floating[:, :] z, floating alpha, floating beta, floating dt,
+               floating x0, floating v0):
+    """
+    Run the α–β filter over a batch of measurement streams.
+
+    Returns (x_pred, x_est, vx_pred, vx_est) arrays of shape (S, N).
+    """
+    cdef Py_ssize_t s, n
+    cdef Py_ssize_t S = z.shape[0], N = z.shape[1]
+    cdef floating x_est, vx_est, x_pred, vx_pred, residual
+
+    dtype = np.float32 if floating is float else np.float64
+    x_pred_arr = np.empty((S, N), dtype)
+    x_arr = np.empty((S, N), dtype)
+    v_pred_arr = np.empty((S, N), dtype)
+    v_arr = np.empty((S, N), dtype)
+    cdef floating[:, ::1] x_pred_out = x_pred_arr
+    cdef floating[:, ::1] x_out = x_arr
+    cdef floating[:, ::1] v_pred_out = v_pred_arr
+    cdef floating[:, ::1] v_out = v_arr
+
+    # Loop-invariant constant β/Δt
+    cdef floating beta_over_dt = beta / dt
+
+    for s in range(S):
+
+        x_est = x0
+        vx_est = v0
+
+        for n in range(N):
+
+            # ===== Prediction Step =====
+            x_pred = x_est + dt * vx_est
+            vx_pred = vx_est
+
+            # ===== Update Step =====
+            residual = z[s, n] - x_pred
+            x_est = x_pred + alpha * residual
+            vx_est = vx_pred + beta_over_dt * residual
+
+            x_pred_out[s, n] = x_pred
+            x_out[s, n] = x_est
+            v_pred_out[s, n] = vx_pred
+            v_out[s, n] = vx_est
+
+    return x_pred_arr, x_arr, v_pred_arr, v_arr
+
+
+def alpha_beta_gamma(floating[:, :] z, floating alpha, floating beta, floating gamma,
+                     floating dt, floating x0, floating v0, floating a0):
+    """
+    Run the α–β–γ filter over a batch of measurement streams.
+
+    Returns (x_pred, x_est, vx_pred, vx_est, ax_pred, ax_est) arrays of shape (S, N).
+    """
+    cdef Py_ssize_t s, n
+    cdef Py_ssize_t S = z.shape[0], N = z.shape[1]
+    cdef floating x_est, vx_est, ax_est, x_pred, vx_pred, ax_pred, residual
+
+    dtype = np.float32 if floating is float else np.float64
+    x_pred_arr = np.empty((S, N), dtype)
+    x_arr = np.empty((S, N), dtype)
+    v_pred_arr = np.empty((S, N), dtype)
+    v_arr = np.empty((S, N), dtype)
+    a_pred_arr = np.empty((S, N), dtype)
+    a_arr = np.empty((S, N), dtype)
+    cdef floating[:, ::1] x_pred_out = x_pred_arr
+    cdef floating[:, ::1] x_out = x_arr
+    cdef floating[:, ::1] v_pred_out = v_pred_arr
+    cdef floating[:, ::1] v_out = v_arr
+    cdef floating[:, ::1] a_pred_out = a_pred_arr
+    cdef floating[:, ::1] a_out = a_arr
+
+    # Loop-invariant constants: 0.5*Δt², β/Δt and γ/(0.5*Δt²)
+    cdef floating half_dt2 = <floating>0.5 * dt * dt
+    cdef floating beta_over_dt = beta / dt
+    cdef floating gamma_over_half_dt2 = gamma / half_dt2
+
+    for s in range(S):
+
+        x_est = x0
+        vx_est = v0
+        ax_est = a0
+
+        for n in range(N):
+
+            # ====== PREDICTION STEP ======
+            x_pred = x_est + dt * vx_est + half_dt2 * ax_est
+            vx_pred = vx_est + dt * ax_est
+            ax_pred = ax_est
+
+            # ====== UPDATE STEP ======
+            residual = z[s, n] - x_pred
+            x_est = x_pred + alpha * residual
+            vx_est = vx_pred + beta_over_dt * residual
+            ax_est = ax_pred + gamma_over_half_dt2 * residual
+
+            x_pred_out[s, n] = x_pred
+            x_out[s, n] = x_est
+            v_pred_out[s, n] = vx_pred
+            v_out[s, n] = vx_est
+            a_pred_out[s, n] = ax_pred
+            a_out[s, n] = ax_est
+
+    return x_pred_arr, x_arr, v_pred_arr, v_arr, a_pred_arr, a_arr
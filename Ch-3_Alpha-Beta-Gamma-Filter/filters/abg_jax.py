@@ -0,0 +1,82 @@
+"""
+JAX Version of the α–β and α–β–γ Filter Kernels
+
+Each step of the filter is written as a pure function
+
+    step(carry, z(n)) -> (new_carry, outputs)
+
+where the carry is the state estimate [ x'(n,n), vx'(n,n), ax'(n,n) ] and the outputs are
+the predictions and estimates recorded at step n. jax.lax.scan() runs this step over the
+whole measurement sequence inside one compiled XLA loop, and jax.vmap() adds the batch
+axis, so a batch of S measurement streams runs as a single call on the CPU, or on a GPU/TPU
+when one is available.
+
+The functions take and return arrays of shape (S, N), just like the Numba kernels in
+abg.py, so they can be swapped in directly:
+
+    from filters.abg_jax import alpha_beta_gamma
+
+JAX uses float32 unless 'jax_enable_x64' is switched on, so the results match the Numba
+kernels to float32 precision by default.
+"""
+
+import jax
+import jax.numpy as jnp
+
+
+def _alpha_beta_gamma_scan(z, alpha, beta, gamma, dt, x0, v0, a0):
+    """α–β–γ filter over a single stream z of shape (N,)."""
+
+    # Loop-invariant constants: 0.5*Δt², β/Δt and γ/(0.5*Δt²)
+    half_dt2 = 0.5 * dt * dt
+    beta_over_dt = beta / dt
+    gamma_over_half_dt2 = gamma / half_dt2
+
+    def step(carry, z_n):
+        x_est, vx_est, ax_est = carry
+
+        # ====== PREDICTION STEP ======
+        x_pred = x_est + dt * vx_est + half_dt2 * ax_est
+        vx_pred = vx_est + dt * ax_est
+        ax_pred = ax_est
+
+        # ====== UPDATE STEP ======
+        residual = z_n - x_pred
+        x_est = x_pred + alpha * residual
+        vx_est = vx_pred + beta_over_dt * residual
+        ax_est = ax_pred + gamma_over_half_dt2 * residual
+
+        return (x_est, vx_est, ax_est), (x_pred, x_est, vx_pred, vx_est, ax_pred, ax_est)
+
+    # The initial state takes the dtype of the measurements so the carry keeps one dtype
+    init = (jnp.asarray(x0, z.dtype), jnp.asarray(v0, z.dtype), jnp.asarray(a0, z.dtype))
+    _, outputs = jax.lax.scan(step, init, z)
+    return outputs
+
+
+# Map the single-stream scan over the leading (stream) axis of z, sharing all the constants,
+# and compile the mapped function as a whole, so the batching transform is traced once
+# instead of on every call
+_alpha_beta_gamma_batch = jax.jit(jax.vmap(_alpha_beta_gamma_scan,
+                                           in_axes=(0, None, None, None, None, None, None, None)))
+
+
+def alpha_beta(z, alpha, beta, dt, x0, v0):
+    """
+    Run the α–β filter over a batch of measurement streams.
+
+    The α–β filter is the α–β–γ filter with γ = 0 and zero initial acceleration.
+
+    Returns (x_pred, x_est, vx_pred, vx_est) arrays of shape (S, N).
+    """
+    outputs = _alpha_beta_gamma_batch(jnp.asarray(z), alpha, beta, 0.0, dt, x0, v0, 0.0)
+    return outputs[:4]
+
+
+def alpha_beta_gamma(z, alpha, beta, gamma, dt, x0, v0, a0):
+    """
+    Run the α–β–γ filter over a batch of measurement streams.
+
+    Returns (x_pred, x_est, vx_pred, vx_est, ax_pred, ax_est) arrays of shape (S, N).
+    """
+    return _alpha_beta_gamma_batch(jnp.asarray(z), alpha, beta, gamma, dt, x0, v0, a0)
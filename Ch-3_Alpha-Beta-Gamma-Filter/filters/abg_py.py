@@ -0,0 +1,123 @@
+"""
+Pure-Python Version of the α–β and α–β–γ Filter Kernels
+
+Used by the 'filters' package when neither a compiled module nor Numba is available. The
+recursions are the same as in abg.py, but written for the plain CPython interpreter:
+
+- the measurements are read as Python floats (z.tolist()) instead of indexing NumPy
+  arrays element by element, which is slow outside of Numba
+- the results are appended to array('d') buffers, which store unboxed C doubles instead
+  of one Python float object per value as a list would
+- the append methods are looked up once before the loop
+
+The buffers are handed to NumPy without copying (np.frombuffer) and returned with the same
+shapes and dtype as the compiled kernels (the recursion itself always runs in double
+precision, as Python floats are doubles). Like the compiled kernels, they only accept
+(S, N) batches of float32 or float64 measurements and raise TypeError for anything else.
+"""
+
+from array import array
+
+import numpy as np
+
+
+def _check_batch(name, z):
+    """Raise TypeError unless z is an (S, N) batch of float32 or float64 measurements."""
+    if z.ndim != 2:
+        raise TypeError(f"{name}() expects an (S, N) batch of measurement streams, "
+                        f"got a {z.ndim}-D array")
+    if z.dtype not in (np.float32, np.float64):
+        raise TypeError(f"{name}() expects float32 or float64 measurements, got {z.dtype}")
+
+
+def _as_arrays(S, N, dtype, *buffers):
+    """View each array('d') buffer as an (S, N) NumPy array of the requested dtype."""
+    return tuple(np.frombuffer(buf, dtype=np.float64).reshape(S, N).astype(dtype, copy=False)
+                 for buf in buffers)
+
+
+def alpha_beta(z, alpha, beta, dt, x0, v0):
+    """
+    Run the α–β filter over a batch of measurement streams.
+
+    Returns (x_pred, x_est, vx_pred, vx_est) arrays of shape (S, N).
+    """
+    _check_batch('alpha_beta', z)
+    S, N = z.shape
+    x_pred_buf, x_buf, v_pred_buf, v_buf = array('d'), array('d'), array('d'), array('d')
+    x_pred_app, x_app = x_pred_buf.append, x_buf.append
+    v_pred_app, v_app = v_pred_buf.append, v_buf.append
+
+    # Loop-invariant constant β/Δt
+    beta_over_dt = beta / dt
+
+    for stream in z.tolist():
+
+        x_est = x0
+        vx_est = v0
+
+        for z_n in stream:
+
+            # ===== Prediction Step =====
+            x_pred = x_est + dt * vx_est
+            vx_pred = vx_est
+
+            # ===== Update Step =====
+            residual = z_n - x_pred
+            x_est = x_pred + alpha * residual
+            vx_est = vx_pred + beta_over_dt * residual
+
+            x_pred_app(x_pred)
+            x_app(x_est)
+            v_pred_app(vx_pred)
+            v_app(vx_est)
+
+    return _as_arrays(S, N, z.dtype, x_pred_buf, x_buf, v_pred_buf, v_buf)
+
+
+def alpha_beta_gamma(z, alpha, beta, gamma, dt, x0, v0, a0):
+    """
+    Run the α–β–γ filter over a batch of measurement streams.
+
+    Returns (x_pred, x_est, vx_pred, vx_est, ax_pred, ax_est) arrays of shape (S, N).
+    """
+    _check_batch('alpha_beta_gamma', z)
+    S, N = z.shape
+    x_pred_buf, x_buf, v_pred_buf, v_buf = array('d'), array('d'), array('d'), array('d')
+    a_pred_buf, a_buf = array('d'), array('d')
+    x_pred_app, x_app = x_pred_buf.append, x_buf.append
+    v_pred_app, v_app = v_pred_buf.append, v_buf.append
+    a_pred_app, a_app = a_pred_buf.append, a_buf.append
+
+    # Loop-invariant constants: 0.5*Δt², β/Δt and γ/(0.5*Δt²)
+    half_dt2 = 0.5 * dt * dt
+    beta_over_dt = beta / dt
+    gamma_over_half_dt2 = gamma / half_dt2
+
+    for stream in z.tolist():
+
+        x_est = x0
+        vx_est = v0
+        ax_est = a0
+
+        for z_n in stream:
+
+            # ====== PREDICTION STEP ======
+            x_pred = x_est + dt * vx_est + half_dt2 * ax_est
+            vx_pred = vx_est + dt * ax_est
+            ax_pred = ax_est
+
+            # ====== UPDATE STEP ======
+            residual = z_n - x_pred
+            x_est = x_pred + alpha * residual
+            vx_est = vx_pred + beta_over_dt * residual
+            ax_est = ax_pred + gamma_over_half_dt2 * residual
+
+            x_pred_app(x_pred)
+            x_app(x_est)
+            v_pred_app(vx_pred)
+            v_app(vx_est)
+            a_pred_app(ax_pred)
+            a_app(ax_est)
+
+    return _as_arrays(S, N, z.dtype, x_pred_buf, x_buf, v_pred_buf, v_buf, a_pred_buf, a_buf)
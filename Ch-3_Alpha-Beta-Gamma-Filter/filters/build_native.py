@@ -0,0 +1,38 @@
+"""
+Ahead-of-Time Compilation of the α–β(–γ) Kernels
+
+Numba compiles the kernels in abg.py the first time they are called, which costs about a
+second on a cold start. This script compiles the float64 versions once into a native
+extension module 'abg_native' placed next to this file. When it exists, the 'filters'
+package loads the kernels from it, so the example scripts start with no JIT warm-up.
+
+Usage (from the Ch-3 folder, requires Numba and a C compiler):
+
+    python -m filters.build_native
+
+The native module only accepts float64 measurements and runs the streams one after the
+other. The 'filters' package hands it C-contiguous 2-D float64 batches only and passes
+other dtypes (e.g. float32) on to the next kernels. For multi-core runs import the
+kernels from filters.abg.
+
+numba.pycc is deprecated (Numba 0.68 emits a NumbaPendingDeprecationWarning when it is
+imported) and will be removed from Numba; the Cython build (see setup.py) gives the same
+start-up without depending on it.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from .abg import alpha_beta, alpha_beta_gamma
+
+cc = CC('abg_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('alpha_beta',
+          'UniTuple(f8[:,:], 4)(f8[:,:], f8, f8, f8, f8, f8)')(alpha_beta.py_func)
+cc.export('alpha_beta_gamma',
+          'UniTuple(f8[:,:], 6)(f8[:,:], f8, f8, f8, f8, f8, f8, f8)')(alpha_beta_gamma.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,66 @@
+"""
+Plotting Helper Shared by the Chapter 3 Examples
+
+Only the predicted and estimated lines of a plot depend on the filter gains. So when
+main() is called again while its figure is still open (e.g. when tuning the gains from
+'python -i Ex-4.py' with interactive plotting switched on), show_results() swaps the data
+of those lines with set_ydata() and redraws the figure, instead of rebuilding the axes,
+ticks and legends from scratch.
+
+pyplot itself is imported through import_pyplot(), which picks the backend as in Chapter 5.
+"""
+
+import os
+
+# Figure and filter result lines of the last plot of every example, keyed by the
+# function that built them
+_figures = {}
+
+
+def import_pyplot(save=None):
+    """
+    Import and return matplotlib.pyplot for plotting the results.
+
+    The scripts only call this when they plot, since pyplot takes far longer to import
+    than the filters take to run. Nothing is shown when the plots are saved to a file, so
+    then, unless a backend is chosen through MPLBACKEND, the non-interactive Agg backend
+    is used instead of loading a GUI toolkit.
+    """
+    if save:
+        import matplotlib
+        matplotlib.use(os.environ.get('MPLBACKEND', 'Agg'))
+
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def show_results(build, save=None, **filter_results):
+    """
+    Plot the filter results, reusing the figure of the previous call while it is open.
+
+    build          = Function build(plt, **filter_results) that draws a new figure and
+                     returns it together with a dict mapping the names of filter_results
+                     to the lines that show them
+    save           = File to save the figure to instead of showing it, or None
+    filter_results = Arrays of the predicted and estimated values, by name
+    """
+    plt = import_pyplot(save)
+
+    fig, lines = _figures.get(build, (None, None))
+
+    if fig is not None and plt.fignum_exists(fig.number):
+        for name, values in filter_results.items():
+            lines[name].set_ydata(values)
+        for ax in fig.axes:
+            ax.relim()
+            ax.autoscale_view()
+        fig.canvas.draw_idle()
+    else:
+        fig, lines = build(plt, **filter_results)
+        _figures[build] = fig, lines
+        fig.tight_layout()
+
+    if save:
+        fig.savefig(save)
+    else:
+        plt.show()
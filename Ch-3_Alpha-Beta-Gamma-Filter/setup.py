@@ -0,0 +1,15 @@
+"""
+Builds the Cython version of the α–β(–γ) filter kernels (filters/abg_cy.pyx).
+
+Usage (from this folder, requires Cython and a C compiler):
+
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='abg-filters',
+    ext_modules=cythonize('filters/abg_cy.pyx'),
+)
@@ -50,8 +50,11 @@ Given Data:
 - Measurements = [49.03, 48.44, 55.21, 49.98, 50.6, 52.61, 45.87, 42.64, 48.26, 55.84]
 """
 
+import argparse
+import os
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
 
 # ==== Initialization ====
 
@@ -60,72 +63,106 @@ initial_estimate = 60.0               # Initial guess of the height
 initial_variance = 15 ** 2            # Variance = std_dev^2 = 225
 measurement_variance = 5 ** 2         # Measurement variance (r) = 25
 
-measurements = [49.03, 48.44, 55.21, 49.98, 50.6,
-                52.61, 45.87, 42.64, 48.26, 55.84]
-
-# Initialize lists to store results
-time_steps = list(range(1, len(measurements) + 1))
-estimates = []
-variances = []
-kalman_gains = []
-predictions = []
-
-# Initialize the first estimate and variance
-x_est = initial_estimate
-p_est = initial_variance
-
-# ==== Kalman Filter Iteration ====
-
-for n, z in enumerate(measurements, start=1):
-
-    # Step 1: Prediction
-    x_pred = x_est           # Since system is static
-    p_pred = p_est
-
-    # Store predicted value for plotting
-    predictions.append(x_pred)
-
-    # Step 2: Measurement update
-    K = p_pred / (p_pred + measurement_variance)           # Kalman Gain
-    x_est = x_pred + K * (z - x_pred)                      # Update estimate
-    p_est = (1 - K) * p_pred                               # Update variance
-
-    # Store results
-    kalman_gains.append(K)
-    estimates.append(x_est)
-    variances.append(p_est)
-
-# ==== Tabular Output ====
-print(f"{'Time Step':<10} {'Measurement':<12} {'Prediction':<12} {'Estimate':<12} {'Variance':<10} {'Kalman Gain':<12}")
-print('-' * 70)
-for i in range(len(measurements)):
-    print(f"{time_steps[i]:<10} {measurements[i]:<12.2f} {predictions[i]:<12.2f} {estimates[i]:<12.2f} {variances[i]:<10.2f} {kalman_gains[i]:<12.2f}")
-
-# ==== Plotting ====
-
-# Plot of true height, measurements, estimates
-plt.figure(figsize=(10, 6))
-plt.plot(time_steps, [true_height] * len(time_steps), 'k--', label='True Height')
-plt.plot(time_steps, measurements, 'ro-', label='Measured Height')
-plt.plot(time_steps, estimates, 'bs-', label='Estimated Height')
-plt.plot(time_steps, predictions, 'g^-', label='Predicted Height')
-plt.title('1D Kalman Filter: Building Height Estimation')
-plt.xlabel('Measurement Number')
-plt.ylabel('Height (m)')
-plt.grid(True)
-plt.legend()
-plt.tight_layout()
-plt.show(block=False)
-
-# Plot Kalman Gain vs time
-plt.figure(figsize=(10, 4))
-plt.plot(time_steps, kalman_gains, 'mo-', label='Kalman Gain')
-plt.title('Kalman Gain Over Time')
-plt.xlabel('Measurement Number')
-plt.ylabel('Kalman Gain')
-plt.grid(True)
-plt.legend()
-plt.tight_layout()
-plt.show()
-
-input("\nPress Enter to close all plots...")
+measurements = np.asarray([49.03, 48.44, 55.21, 49.98, 50.6,
+                           52.61, 45.87, 42.64, 48.26, 55.84], dtype=np.float64)
+N = measurements.size
+time_steps = np.arange(1, N + 1)
+
+
+def main(plot=False, save=None):
+    """Run the filter, print the results table and optionally plot them."""
+
+    # Preallocate array to store results (one slot per measurement)
+    estimates = np.empty(N)
+
+    # ==== Precomputed Variances and Kalman Gains ====
+
+    """
+    Since there is no process noise and r is constant, the variance does not depend on
+    the measurements at all. Taking the reciprocal of the variance update:
+
+        1/pₙ,ₙ = 1/pₙ₋₁,ₙ₋₁ + 1/r    →    pₙ,ₙ = 1 / (1/p₀,₀ + n/r)
+
+    and the Kalman Gain Kₙ = pₙ₋₁,ₙ₋₁ / (pₙ₋₁,ₙ₋₁ + r) simplifies to Kₙ = pₙ,ₙ / r.
+
+    So all variances and gains are computed once with NumPy before the filter loop.
+    """
+    n_arr = np.arange(1, N + 1, dtype=np.float64)
+    variances = 1.0 / (1.0 / initial_variance + n_arr / measurement_variance)
+    kalman_gains = variances / measurement_variance
+
+    # Initialize the first estimate
+    x_est = initial_estimate
+
+    # ==== Kalman Filter Iteration ====
+
+    # Only the state update is left in the loop, using the precomputed gains
+    # (the prediction x̂ₙ,ₙ₋₁ is just the previous estimate, so it is not needed here)
+    for n, (z, K) in enumerate(zip(measurements.tolist(), kalman_gains.tolist())):
+
+        # Measurement update
+        x_est = x_est + K * (z - x_est)                        # Update estimate
+
+        # Store results
+        estimates[n] = x_est
+
+    # Prediction: since the system is static, x̂ₙ,ₙ₋₁ = x̂ₙ₋₁,ₙ₋₁, i.e. the predictions
+    # are the initial estimate followed by all but the last estimate
+    predictions = np.empty(N)
+    predictions[0] = initial_estimate
+    predictions[1:] = estimates[:-1]
+
+    # ==== Tabular Output ====
+    print(f"{'Time Step':<10} {'Measurement':<12} {'Prediction':<12} {'Estimate':<12} {'Variance':<10} {'Kalman Gain':<12}")
+    print('-' * 70)
+    table = np.column_stack([time_steps, measurements, predictions, estimates, variances, kalman_gains])
+    np.savetxt(sys.stdout, table, fmt='%-10d %-12.2f %-12.2f %-12.2f %-10.2f %-12.2f')
+
+    if plot or save:
+        if save:
+            # Nothing is shown when saving, so unless a backend is chosen through
+            # MPLBACKEND, use the non-interactive Agg backend instead of loading a GUI toolkit
+            import matplotlib
+            matplotlib.use(os.environ.get('MPLBACKEND', 'Agg'))
+
+        # pyplot is imported only when plotting, since it takes far longer to import
+        # than the filter itself takes to run
+        import matplotlib.pyplot as plt
+
+        # ==== Plotting ====
+        fig, (ax_height, ax_gain) = plt.subplots(2, 1, sharex=True, figsize=(10, 10),
+                                                 gridspec_kw={'height_ratios': [3, 2]})
+
+        # Plot of true height, measurements, estimates
+        ax_height.plot(time_steps, np.full(N, true_height), 'k--', label='True Height')
+        ax_height.plot(time_steps, measurements, 'ro-', label='Measured Height')
+        ax_height.plot(time_steps, estimates, 'bs-', label='Estimated Height')
+        ax_height.plot(time_steps, predictions, 'g^-', label='Predicted Height')
+        ax_height.set_title('1D Kalman Filter: Building Height Estimation')
+        ax_height.set_ylabel('Height (m)')
+        ax_height.grid(True)
+        ax_height.legend()
+
+        # Plot Kalman Gain vs time
+        ax_gain.plot(time_steps, kalman_gains, 'mo-', label='Kalman Gain')
+        ax_gain.set_title('Kalman Gain Over Time')
+        ax_gain.set_xlabel('Measurement Number')
+        ax_gain.set_ylabel('Kalman Gain')
+        ax_gain.grid(True)
+        ax_gain.legend()
+
+        fig.tight_layout()
+
+        # Save to a file for non-interactive runs, otherwise show the plots
+        if save:
+            fig.savefig(save)
+        else:
+            plt.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Estimating the Height of a Building using One-Dimensional Kalman Filter")
+    parser.add_argument("--plot", action="store_true", help="show the plots of the results")
+    parser.add_argument("--save", metavar="FILE", help="save the plots to FILE instead of showing them")
+    args = parser.parse_args()
+    main(plot=args.plot, save=args.save)
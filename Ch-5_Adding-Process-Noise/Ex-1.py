@@ -54,17 +54,22 @@ Given Data for the Example:
 - Process noise variance (q): 0.0001
 """
 
+import argparse
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from kf_core import run_kf, steady_state_gain
+from plotting import import_pyplot
 
 # ==== Initialization ====
 
 # True values and measurements
-true_temperatures = [50.005, 49.994, 49.993, 50.001, 50.006,
-                     49.998, 50.021, 50.005, 50.0, 49.997]
+true_temperatures = np.array([50.005, 49.994, 49.993, 50.001, 50.006,
+                             49.998, 50.021, 50.005, 50.0, 49.997], dtype=np.float64)
 
-measurements = [49.986, 49.963, 50.09, 50.001, 50.018,
-                50.05, 49.938, 49.858, 49.965, 50.114]
+measurements = np.array([49.986, 49.963, 50.09, 50.001, 50.018,
+                        50.05, 49.938, 49.858, 49.965, 50.114], dtype=np.float64)
 
 # Initial estimate (far from true value)
 x_est = 60.0
@@ -74,65 +79,68 @@ p_est = 100**2                 # Initial variance = 10000
 measurement_variance = 0.1**2  # r = 0.01
 process_variance = 0.0001      # q = 0.0001
 
-# Lists for logging results
-estimates = []
-predictions = []
-variances = []
-kalman_gains = []
-time_steps = list(range(1, len(measurements) + 1))
-
-# ==== Kalman Filter Iteration ====
-
-for n, z in enumerate(measurements, start=1):
-
-    # Step 1: Prediction
-    x_pred = x_est                      # Prediction equals previous estimate
-    p_pred = p_est + process_variance  # Add process noise
-    predictions.append(x_pred)
-
-    # Step 2: Update
-    K = p_pred / (p_pred + measurement_variance)           # Kalman Gain
-    x_est = x_pred + K * (z - x_pred)                      # Updated estimate
-    p_est = (1 - K) * p_pred                               # Updated variance
-
-    # Store results
-    estimates.append(x_est)
-    variances.append(p_est)
-    kalman_gains.append(K)
-
-# ==== Tabular Output ====
-print(f"{'Time':<6} {'True Temp':<10} {'Measured':<10} {'Predicted':<12} {'Estimate':<10} {'Variance':<10} {'Gain':<10}")
-print('-' * 72)
-for i in range(len(measurements)):
-    print(f"{time_steps[i]:<6} {true_temperatures[i]:<10.3f} {measurements[i]:<10.3f} {predictions[i]:<12.3f} {estimates[i]:<10.3f} {variances[i]:<10.6f} {kalman_gains[i]:<10.6f}")
-
-# ==== Plotting Results ====
-
-# Plot true, measured, predicted, estimated temperatures
-plt.figure(figsize=(10, 6))
-plt.plot(time_steps, true_temperatures, 'k--', label='True Temperature')
-plt.plot(time_steps, measurements, 'ro-', label='Measured Temperature')
-plt.plot(time_steps, predictions, 'g^-', label='Predicted Temperature')
-plt.plot(time_steps, estimates, 'bs-', label='Estimated Temperature')
-plt.title('1D Kalman Filter with Process Noise: Temperature Estimation')
-plt.xlabel('Time Step')
-plt.ylabel('Temperature (°C)')
-plt.grid(True)
-plt.legend()
-plt.tight_layout()
-plt.show(block=False)
-
-# Plot Kalman Gain over time
-plt.figure(figsize=(10, 4))
-plt.plot(time_steps, kalman_gains, 'mo-', label='Kalman Gain')
-plt.title('Kalman Gain over Time')
-plt.xlabel('Time Step')
-plt.ylabel('Kalman Gain')
-plt.grid(True)
-plt.legend()
-plt.tight_layout()
-plt.show()
-
-# Wait for user to close plots
-input("\nPress Enter to close all plots...")
-
+time_steps = np.arange(1, measurements.size + 1)
+
+
+def main(plot=False, save=None):
+    """Run the filter, print the results table and optionally plot them."""
+
+    # ==== Kalman Filter Iteration ====
+
+    predictions, estimates, variances, kalman_gains = run_kf(measurements, x_est, p_est,
+                                                             process_variance, measurement_variance)
+
+    # ==== Tabular Output ====
+    print(f"{'Time':<6} {'True Temp':<10} {'Measured':<10} {'Predicted':<12} {'Estimate':<10} {'Variance':<10} {'Gain':<10}")
+    print('-' * 72)
+    table = np.column_stack([time_steps, true_temperatures, measurements, predictions,
+                             estimates, variances, kalman_gains])
+    np.savetxt(sys.stdout, table, fmt='%-6d %-10.3f %-10.3f %-12.3f %-10.3f %-10.6f %-10.6f')
+
+    # ==== Steady-State Gain ====
+    # How far the last gain still is from the steady-state gain the filter converges to
+    K_inf = steady_state_gain(process_variance, measurement_variance)
+    print(f"\nSteady-state Kalman gain K∞ = {K_inf:.6f}, |K{time_steps[-1]} - K∞| = {abs(kalman_gains[-1] - K_inf):.2e}")
+
+    if plot or save:
+        plt = import_pyplot(save)
+
+        # ==== Plotting Results ====
+        # One figure with the temperatures on top and the Kalman gain below,
+        # sharing the time axis
+        fig, (ax_temp, ax_gain) = plt.subplots(2, 1, sharex=True, figsize=(10, 10),
+                                               gridspec_kw={'height_ratios': [3, 2]})
+
+        # Plot true, measured, predicted, estimated temperatures
+        ax_temp.plot(time_steps, true_temperatures, 'k--', label='True Temperature')
+        ax_temp.plot(time_steps, measurements, 'ro-', label='Measured Temperature')
+        ax_temp.plot(time_steps, predictions, 'g^-', label='Predicted Temperature')
+        ax_temp.plot(time_steps, estimates, 'bs-', label='Estimated Temperature')
+        ax_temp.set_title('1D Kalman Filter with Process Noise: Temperature Estimation')
+        ax_temp.set_ylabel('Temperature (°C)')
+        ax_temp.grid(True)
+        ax_temp.legend()
+
+        # Plot Kalman Gain over time
+        ax_gain.plot(time_steps, kalman_gains, 'mo-', label='Kalman Gain')
+        ax_gain.set_title('Kalman Gain over Time')
+        ax_gain.set_xlabel('Time Step')
+        ax_gain.set_ylabel('Kalman Gain')
+        ax_gain.grid(True)
+        ax_gain.legend()
+
+        fig.tight_layout()
+
+        # Save to a file for non-interactive runs, otherwise show the plots
+        if save:
+            fig.savefig(save)
+        else:
+            plt.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="1D Kalman Filter with Process Noise: Liquid Temperature (Example 6)")
+    parser.add_argument("--plot", action="store_true", help="show the plots of the results")
+    parser.add_argument("--save", metavar="FILE", help="save the plots to FILE instead of showing them")
+    args = parser.parse_args()
+    main(plot=args.plot, save=args.save)
@@ -34,15 +34,20 @@ Where:
 - q = 0.0001, r = 0.01 (variance of process and measurement noise)
 """
 
+import argparse
+import os
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
 
-# True values and measurements
-true_temps = [50.505, 50.994, 51.493, 52.001, 52.506,
-              52.998, 53.521, 54.005, 54.5, 54.997]
+from kf_core import run_kf, steady_state_gain
+from plotting import import_pyplot
 
-measurements = [50.486, 50.963, 51.597, 52.001, 52.518,
-                53.05, 53.438, 53.858, 54.465, 55.114]
+# True values and measurements
+# (stored once in heating_liquid.npy, which Examples 7 and 8 share: first row true values,
+# second row measurements; memory-mapped instead of being read and parsed)
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heating_liquid.npy')
+true_temps, measurements = np.load(DATA_FILE, mmap_mode='r')
 
 # Initial values
 x_est = 10.0
@@ -50,53 +55,64 @@ p_est = 10000.0
 q = 0.0001
 r = 0.01
 
-# Storage
-predictions, estimates, kalman_gains, variances = [], [], [], []
-time_steps = list(range(1, len(measurements) + 1))
-
-for z in measurements:
-    x_pred = x_est
-    p_pred = p_est + q
-
-    K = p_pred / (p_pred + r)
-    x_est = x_pred + K * (z - x_pred)
-    p_est = (1 - K) * p_pred
-
-    predictions.append(x_pred)
-    estimates.append(x_est)
-    kalman_gains.append(K)
-    variances.append(p_est)
-
-# Print table
-print(f"{'Time':<6} {'True':<10} {'Measured':<10} {'Predicted':<12} {'Estimate':<10} {'Gain':<10} {'Variance':<10}")
-print("-" * 72)
-for i in range(len(time_steps)):
-    print(f"{time_steps[i]:<6} {true_temps[i]:<10.3f} {measurements[i]:<10.3f} {predictions[i]:<12.3f} "
-          f"{estimates[i]:<10.3f} {kalman_gains[i]:<10.6f} {variances[i]:<10.6f}")
-
-# Plot results
-plt.figure(figsize=(10, 6))
-plt.plot(time_steps, true_temps, 'k--', label='True Temperature')
-plt.plot(time_steps, measurements, 'ro-', label='Measured')
-plt.plot(time_steps, predictions, 'g^-', label='Predicted')
-plt.plot(time_steps, estimates, 'bs-', label='Estimated')
-plt.title("Example 7 – KF with Low Process Noise (q = 0.0001)")
-plt.xlabel("Time Step")
-plt.ylabel("Temperature (°C)")
-plt.legend()
-plt.grid()
-plt.tight_layout()
-plt.show(block=False)
-
-# Kalman gain plot
-plt.figure(figsize=(10, 4))
-plt.plot(time_steps, kalman_gains, 'mo-', label='Kalman Gain')
-plt.title("Kalman Gain Over Time – Example 7")
-plt.xlabel("Time Step")
-plt.ylabel("Gain")
-plt.legend()
-plt.grid()
-plt.tight_layout()
-plt.show()
-
-input("\nPress Enter to close plots...")
+time_steps = np.arange(1, measurements.size + 1)
+
+
+def main(plot=False, save=None):
+    """Run the filter, print the results table and optionally plot them."""
+
+    predictions, estimates, variances, kalman_gains = run_kf(measurements, x_est, p_est, q, r)
+
+    # Print table
+    print(f"{'Time':<6} {'True':<10} {'Measured':<10} {'Predicted':<12} {'Estimate':<10} {'Gain':<10} {'Variance':<10}")
+    print("-" * 72)
+    table = np.column_stack([time_steps, true_temps, measurements, predictions,
+                             estimates, kalman_gains, variances])
+    np.savetxt(sys.stdout, table, fmt='%-6d %-10.3f %-10.3f %-12.3f %-10.3f %-10.6f %-10.6f')
+
+    # ==== Steady-State Gain ====
+    # How far the last gain still is from the steady-state gain the filter converges to
+    K_inf = steady_state_gain(q, r)
+    print(f"\nSteady-state Kalman gain K∞ = {K_inf:.6f}, |K{time_steps[-1]} - K∞| = {abs(kalman_gains[-1] - K_inf):.2e}")
+
+    if plot or save:
+        plt = import_pyplot(save)
+
+        # Plot results: one figure with the temperatures on top and the Kalman gain
+        # below, sharing the time axis
+        fig, (ax_temp, ax_gain) = plt.subplots(2, 1, sharex=True, figsize=(10, 10),
+                                               gridspec_kw={'height_ratios': [3, 2]})
+
+        # Temperature plot
+        ax_temp.plot(time_steps, true_temps, 'k--', label='True Temperature')
+        ax_temp.plot(time_steps, measurements, 'ro-', label='Measured')
+        ax_temp.plot(time_steps, predictions, 'g^-', label='Predicted')
+        ax_temp.plot(time_steps, estimates, 'bs-', label='Estimated')
+        ax_temp.set_title("Example 7 – KF with Low Process Noise (q = 0.0001)")
+        ax_temp.set_ylabel("Temperature (°C)")
+        ax_temp.legend()
+        ax_temp.grid()
+
+        # Kalman gain plot
+        ax_gain.plot(time_steps, kalman_gains, 'mo-', label='Kalman Gain')
+        ax_gain.set_title("Kalman Gain Over Time – Example 7")
+        ax_gain.set_xlabel("Time Step")
+        ax_gain.set_ylabel("Gain")
+        ax_gain.legend()
+        ax_gain.grid()
+
+        fig.tight_layout()
+
+        # Save to a file for non-interactive runs, otherwise show the plots
+        if save:
+            fig.savefig(save)
+        else:
+            plt.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="1D Kalman Filter with Low Process Noise: Heating Liquid (Example 7)")
+    parser.add_argument("--plot", action="store_true", help="show the plots of the results")
+    parser.add_argument("--save", metavar="FILE", help="save the plots to FILE instead of showing them")
+    args = parser.parse_args()
+    main(plot=args.plot, save=args.save)
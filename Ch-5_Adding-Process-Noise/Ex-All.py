@@ -0,0 +1,118 @@
+"""
+Examples 6, 7 and 8 in One Batched Run
+
+Ex-1, Ex-2 and Ex-3 run the same 1D Kalman filter (constant system model with process
+noise), only with different data, initial estimates and process noise variances (q):
+
+- Example 6: liquid at constant temperature,       x̂₀,₀ = 60.0, q = 0.0001
+- Example 7: heating liquid, low process noise,    x̂₀,₀ = 10.0, q = 0.0001
+- Example 8: heating liquid, higher process noise, x̂₀,₀ = 10.0, q = 0.15
+
+Here the three examples are stacked along a stream axis of length 3 and run together by
+kalman_1d_batch(), which runs the compiled recursion over all three rows in one call, and
+the results of all examples are printed and plotted side by side.
+
+Equations, for every example s:
+
+    pₙ,ₙ₋₁ = pₙ₋₁,ₙ₋₁ + q[s]
+    Kₙ     = pₙ,ₙ₋₁ / (pₙ,ₙ₋₁ + r)
+    x̂ₙ,ₙ   = x̂ₙ₋₁,ₙ₋₁ + Kₙ * (zₙ[s] - x̂ₙ₋₁,ₙ₋₁)
+    pₙ,ₙ   = (1 - Kₙ) * pₙ,ₙ₋₁
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from kf_core import kalman_1d_batch, steady_state_gain
+from plotting import import_pyplot
+
+examples = ['Example 6 – Liquid Temperature (q = 0.0001)',
+            'Example 7 – Heating Liquid, Low Process Noise (q = 0.0001)',
+            'Example 8 – Heating Liquid, Higher Process Noise (q = 0.15)']
+
+# Examples 7 and 8 share their true values and measurements (heating_liquid.npy, see Ex-2.py)
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'heating_liquid.npy')
+heating_true, heating_measured = np.load(DATA_FILE, mmap_mode='r')
+
+# True values and measurements, one row per example
+true_temps = np.array([[50.005, 49.994, 49.993, 50.001, 50.006, 49.998, 50.021, 50.005, 50.0, 49.997],
+                       heating_true,
+                       heating_true])
+
+measurements = np.array([[49.986, 49.963, 50.09, 50.001, 50.018, 50.05, 49.938, 49.858, 49.965, 50.114],
+                         heating_measured,
+                         heating_measured])
+
+# Initial values, per example where they differ
+x_est = np.array([60.0, 10.0, 10.0])
+p_est = 10000.0
+q = np.array([0.0001, 0.0001, 0.15])
+r = 0.01
+
+time_steps = np.arange(1, measurements.shape[1] + 1)
+
+
+def main(plot=False, save=None):
+    """Run the three filters, print their results tables and optionally plot them."""
+
+    # ==== Kalman Filter Iteration (all three examples at once) ====
+    predictions, estimates, variances, kalman_gains = kalman_1d_batch(measurements, x_est,
+                                                                      p_est, q, r)
+
+    # Steady-state gains the three filters converge to
+    K_inf = steady_state_gain(q, r)
+
+    # ==== Tabular Output ====
+    for s, title in enumerate(examples):
+        print(f"\n{title}\n")
+        print(f"{'Time':<6} {'True Temp':<10} {'Measured':<10} {'Predicted':<12} {'Estimate':<10} {'Variance':<10} {'Gain':<10}")
+        print('-' * 72)
+        table = np.column_stack([time_steps, true_temps[s], measurements[s], predictions[s],
+                                 estimates[s], variances[s], kalman_gains[s]])
+        np.savetxt(sys.stdout, table, fmt='%-6d %-10.3f %-10.3f %-12.3f %-10.3f %-10.6f %-10.6f')
+        print(f"\nSteady-state Kalman gain K∞ = {K_inf[s]:.6f}, "
+              f"|K{time_steps[-1]} - K∞| = {abs(kalman_gains[s, -1] - K_inf[s]):.2e}")
+
+    if plot or save:
+        plt = import_pyplot(save)
+
+        # ==== Plotting Results ====
+        # One column per example: temperatures on top, Kalman gain below
+        fig, axes = plt.subplots(2, len(examples), sharex=True, figsize=(16, 8))
+
+        for s, title in enumerate(examples):
+            ax_temp, ax_gain = axes[:, s]
+
+            ax_temp.plot(time_steps, true_temps[s], 'k--', label='True Temperature')
+            ax_temp.plot(time_steps, measurements[s], 'ro-', label='Measured')
+            ax_temp.plot(time_steps, predictions[s], 'g^-', label='Predicted')
+            ax_temp.plot(time_steps, estimates[s], 'bs-', label='Estimated')
+            ax_temp.set_title(title, fontsize='medium')
+            ax_temp.set_ylabel('Temperature (°C)')
+            ax_temp.legend()
+            ax_temp.grid(True)
+
+            ax_gain.plot(time_steps, kalman_gains[s], 'mo-', label='Kalman Gain')
+            ax_gain.set_xlabel('Time Step')
+            ax_gain.set_ylabel('Kalman Gain')
+            ax_gain.legend()
+            ax_gain.grid(True)
+
+        fig.tight_layout()
+
+        # Save to a file for non-interactive runs, otherwise show the plots
+        if save:
+            fig.savefig(save)
+        else:
+            plt.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Examples 6, 7 and 8 of Chapter 5 in one batched run")
+    parser.add_argument("--plot", action="store_true", help="show the plots of the results")
+    parser.add_argument("--save", metavar="FILE", help="save the plots to FILE instead of showing them")
+    args = parser.parse_args()
+    main(plot=args.plot, save=args.save)
@@ -0,0 +1,296 @@
+"""
+1D Kalman Filter shared by the Chapter 5 examples
+
+Ex-1, Ex-2 and Ex-3 all run the same constant-model Kalman filter, only the measurements,
+the initial guess and the process noise variance q change. So the filter lives here once
+and the example scripts only prepare the data, call run_kf() and print/plot the results.
+
+kalman_1d() is the plain recursion, written with scalar locals and preallocated output
+arrays so Numba can compile it to machine code (cache=True keeps the compiled code on disk,
+so only the very first run pays the JIT warm-up). Numba is optional: without it the
+function simply runs as plain Python.
+
+run_kf() runs kalman_1d() over all measurements when it is compiled. As plain Python it
+only uses kalman_1d() while the Kalman gain is still changing, and hands a long
+steady-state part to scipy.signal.lfilter() (see its docstring). SciPy is optional and
+only imported without Numba, for runs with at least MIN_LFILTER_STEPS steps left after
+the gain has converged. The gain and variance do not depend on the measurements, so
+steady_state_step() works out from their closed form when the gain converges, and
+gain_trajectory() computes the steady-state part of them for the lfilter() path.
+
+kalman_1d_batch() runs several filters, one per row of a batch (e.g. the three examples,
+which only differ in their data, x̂₀,₀ and q), through one call of the compiled recursion.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional: without it kalman_1d() simply runs as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# run_kf() switches to the steady-state gain once |Kₙ - K∞| <= STEADY_STATE_TOL * K∞
+STEADY_STATE_TOL = 1e-12
+
+# ... and, when kalman_1d() runs as plain Python, hands the rest to lfilter() only when at
+# least this many steps are left, since importing scipy.signal (well over half a second)
+# takes longer than kalman_1d() takes for a shorter tail. Compiled, kalman_1d() is faster
+# than lfilter() even without the import
+MIN_LFILTER_STEPS = 1_000_000
+
+
+def steady_state_gain(q, r):
+    """
+    Steady-state Kalman gain K∞ of the 1D constant-model filter.
+
+    In steady state the variance repeats itself, p* = (p* + q) * r / (p* + q + r), which
+    is the quadratic p*² + q * p* - q * r = 0 with the positive root
+
+        p* = 0.5 * (-q + sqrt(q² + 4 * q * r))
+
+    and the gain that goes with it is K∞ = (p* + q) / (p* + q + r). p* itself loses its
+    digits to cancellation when q ≫ r, so the gain is computed from the exact sum
+    p* + q = 0.5 * (q + sqrt(q² + 4 * q * r)) instead.
+    """
+    p_plus_q = 0.5 * (q + np.sqrt(q * q + 4 * q * r))
+    return p_plus_q / (p_plus_q + r)
+
+
+def _trajectory_constants(q, r):
+    """
+    Fixed points p* and p⁻ and log(λ) of the variance update, for q > 0 (see
+    gain_trajectory()).
+    """
+    root = np.sqrt(q * q + 4 * q * r)
+    p_pos = 2 * q * r / (q + root)
+    p_neg = -0.5 * (q + root)
+    log_lam = -2 * np.log1p((p_pos + q) / r)
+    return p_pos, p_neg, log_lam
+
+
+def gain_trajectory(p0, q, r, N, start=0):
+    """
+    Kalman gains Kₙ and variances pₙ,ₙ of steps start+1 to N, computed in closed form.
+
+    The variance update pₙ,ₙ = (pₙ₋₁,ₙ₋₁ + q) * r / (pₙ₋₁,ₙ₋₁ + q + r) is a Möbius map
+    with two fixed points, p* ≥ 0 (see steady_state_gain()) and
+
+        p⁻ = 0.5 * (-q - sqrt(q² + 4 * q * r))
+
+    Measured relative to them the variance is a plain geometric sequence:
+
+        (pₙ,ₙ - p*) / (pₙ,ₙ - p⁻) = λⁿ * (p₀,₀ - p*) / (p₀,₀ - p⁻)
+
+        λ = (p⁻ + q + r) / (p* + q + r)
+
+    so all the values are computed at once, without the steps before them. When q ≫ r,
+    -q + sqrt(...) and p⁻ + q + r cancel to nothing, so they are computed from the exact
+    equivalents
+
+        p* = 2 * q * r / (q + sqrt(q² + 4 * q * r))
+
+        p⁻ + q + r = r² / (p* + q + r),   i.e.   λ = (r / (p* + q + r))²
+
+    For q = 0 both fixed points are 0 and the variance is simply
+    pₙ,ₙ = p₀,₀ * r / (r + n * p₀,₀). The gain follows from Kₙ = pₙ,ₙ / r.
+
+    With a large p₀,₀ this is also more accurate than the recursion itself, which loses
+    digits in (1 - Kₙ) while Kₙ is close to 1.
+
+    Returns (kalman_gains, variances) arrays of length N - start.
+    """
+    n = np.arange(start + 1, N + 1)
+    if q == 0:
+        variances = p0 * r / (r + n * p0)
+    else:
+        p_pos, p_neg, log_lam = _trajectory_constants(q, r)
+        lam_n = np.exp(n * log_lam)
+        c = (p0 - p_pos) / (p0 - p_neg) * lam_n
+        # 1 - c, written so that it keeps its digits when c is close to 1
+        one_minus_c = -np.expm1(n * log_lam) + (p_pos - p_neg) / (p0 - p_neg) * lam_n
+        variances = p_pos + (p_pos - p_neg) * c / one_minus_c
+    kalman_gains = variances / r
+    return kalman_gains, variances
+
+
+def steady_state_step(p0, q, r):
+    """
+    Number of steps before the Kalman gain has converged, |Kₙ - K∞| <= STEADY_STATE_TOL * K∞.
+
+    With c = λⁿ * (p₀,₀ - p*) / (p₀,₀ - p⁻) the geometric form of gain_trajectory() gives
+    pₙ,ₙ - p* = (p* - p⁻) * c / (1 - c), and Kₙ - K∞ = (pₙ,ₙ - p*) / r. So the gain has
+    converged once |c| <= t / (1 + t) with t = STEADY_STATE_TOL * p* / (p* - p⁻), which
+    is solved for n directly instead of computing the gains up to there.
+
+    Returns None for q = 0, where K∞ = 0 and the gain only approaches it like 1/n.
+    """
+    if q == 0:
+        return None
+    p_pos, p_neg, log_lam = _trajectory_constants(q, r)
+    c0 = abs((p0 - p_pos) / (p0 - p_neg))
+    t = STEADY_STATE_TOL * p_pos / (p_pos - p_neg)
+    if c0 <= t / (1 + t):
+        return 0
+    # First step n that has converged; the steps before it are the ones not converged
+    return max(int(np.ceil(np.log(t / (1 + t) / c0) / log_lam)) - 1, 0)
+
+
+@njit(cache=True)
+def kalman_1d(z, x0, p0, q, r):
+    """
+    Run the 1D Kalman filter step by step over all measurements z.
+
+    z  = Measurements zₙ (float64 array)
+    x0 = Initial estimate x̂₀,₀
+    p0 = Initial estimate variance p₀,₀
+    q  = Process noise variance
+    r  = Measurement variance
+
+    Returns (predictions, estimates, variances, kalman_gains) arrays.
+    """
+    N = z.size
+    predictions = np.empty(N)
+    estimates = np.empty(N)
+    variances = np.empty(N)
+    kalman_gains = np.empty(N)
+
+    x_est = x0
+    p_est = p0
+
+    for n in range(N):
+
+        # Step 1: Prediction
+        x_pred = x_est                 # Prediction equals previous estimate
+        p_pred = p_est + q             # Add process noise
+
+        # Step 2: Update
+        K = p_pred / (p_pred + r)           # Kalman Gain
+        x_est = x_pred + K * (z[n] - x_pred)  # Updated estimate
+        p_est = (1 - K) * p_pred            # Updated variance
+
+        estimates[n] = x_est
+        variances[n] = p_est
+        kalman_gains[n] = K
+        predictions[n] = x_pred
+
+    return predictions, estimates, variances, kalman_gains
+
+
+def run_kf(z, x0, p0, q, r):
+    """
+    Run the 1D Kalman filter over all measurements z.
+
+    The variance and the Kalman gain do not depend on the measurements:
+
+        pₙ,ₙ = (pₙ₋₁,ₙ₋₁ + q) * r / (pₙ₋₁,ₙ₋₁ + q + r)
+
+    so the number of steps until the gain has converged to its steady-state value K∞ (see
+    steady_state_gain()) is known in advance (see steady_state_step()). Up to there the filter runs step by step in kalman_1d(). From
+    there on the gain is the constant K∞, and the estimate update
+
+        x̂ₙ,ₙ = (1 - K∞) * x̂ₙ₋₁,ₙ₋₁ + K∞ * zₙ
+
+    is a first order IIR filter, which scipy.signal.lfilter() runs in C. That only pays
+    off when kalman_1d() is not compiled by Numba and at least MIN_LFILTER_STEPS steps are
+    left (for the import of scipy.signal), and needs SciPy to be installed; otherwise
+    kalman_1d() runs all N steps.
+
+    Returns (predictions, estimates, variances, kalman_gains) arrays.
+    """
+    z = np.asarray(z, dtype=np.float64)
+    N = z.size
+
+    if HAVE_NUMBA:
+        return kalman_1d(z, x0, p0, q, r)
+
+    # ==== Steady State (independent of the measurements) ====
+    n_steady = steady_state_step(p0, q, r)
+    if n_steady is None or N - n_steady < MIN_LFILTER_STEPS:
+        return kalman_1d(z, x0, p0, q, r)
+    try:
+        from scipy.signal import lfilter
+    except ImportError:
+        # SciPy is optional: without it kalman_1d() runs the steady state as well
+        return kalman_1d(z, x0, p0, q, r)
+
+    # ==== Time-Varying Gain: step by step ====
+    predictions = np.empty(N)
+    estimates = np.empty(N)
+    variances = np.empty(N)
+    kalman_gains = np.empty(N)
+    (predictions[:n_steady], estimates[:n_steady],
+     variances[:n_steady], kalman_gains[:n_steady]) = kalman_1d(z[:n_steady], x0, p0, q, r)
+
+    # ==== Constant Gain K∞: one lfilter() call, starting from the last estimate ====
+    kalman_gains[n_steady:], variances[n_steady:] = gain_trajectory(p0, q, r, N, n_steady)
+    K_inf = steady_state_gain(q, r)
+    x_est = estimates[n_steady - 1] if n_steady > 0 else x0
+    estimates[n_steady:], _ = lfilter([K_inf], [1.0, -(1.0 - K_inf)], z[n_steady:],
+                                      zi=[(1.0 - K_inf) * x_est])
+    predictions[n_steady] = x_est
+    predictions[n_steady + 1:] = estimates[n_steady:-1]
+
+    return predictions, estimates, variances, kalman_gains
+
+
+@njit(cache=True)
+def _kalman_1d_rows(z, x0, p0, q, r):
+    """
+    Run the 1D Kalman filter over every row of z, with the parameters of row s in x0[s],
+    p0[s], q[s] and r[s] (see kalman_1d_batch()).
+    """
+    S, N = z.shape
+    predictions = np.empty((S, N))
+    estimates = np.empty((S, N))
+    variances = np.empty((S, N))
+    kalman_gains = np.empty((S, N))
+
+    for s in range(S):
+
+        x_est = x0[s]
+        p_est = p0[s]
+        q_s = q[s]
+        r_s = r[s]
+
+        for n in range(N):
+
+            # Step 1: Prediction
+            x_pred = x_est
+            p_pred = p_est + q_s
+
+            # Step 2: Update
+            K = p_pred / (p_pred + r_s)
+            x_est = x_pred + K * (z[s, n] - x_pred)
+            p_est = (1 - K) * p_pred
+
+            estimates[s, n] = x_est
+            variances[s, n] = p_est
+            kalman_gains[s, n] = K
+            predictions[s, n] = x_pred
+
+    return predictions, estimates, variances, kalman_gains
+
+
+def kalman_1d_batch(z, x0, p0, q, r):
+    """
+    Run S 1D Kalman filters, one per row of z.
+
+    z             = Measurements zₙ, array of shape (S, N)
+    x0, p0, q, r  = Initial estimate, initial variance, process noise variance and
+                    measurement variance, either scalars shared by all filters or
+                    arrays of shape (S,)
+
+    Returns (predictions, estimates, variances, kalman_gains) arrays of shape (S, N).
+    """
+    z = np.ascontiguousarray(z, dtype=np.float64)
+    S = z.shape[0]
+    x0, p0, q, r = (np.broadcast_to(np.asarray(a, dtype=np.float64), (S,))
+                    for a in (x0, p0, q, r))
+    return _kalman_1d_rows(z, x0, p0, q, r)
@@ -0,0 +1,25 @@
+"""
+Plotting Helper Shared by the Chapter 5 Examples
+
+The examples only plot when asked to (--plot or --save FILE), and then import pyplot
+through import_pyplot(), which picks the backend to use first.
+"""
+
+import os
+
+
+def import_pyplot(save=None):
+    """
+    Import and return matplotlib.pyplot for plotting the results.
+
+    The scripts only call this when they plot, since pyplot takes far longer to import
+    than the filters take to run. Nothing is shown when the plots are saved to a file, so
+    then, unless a backend is chosen through MPLBACKEND, the non-interactive Agg backend
+    is used instead of loading a GUI toolkit.
+    """
+    if save:
+        import matplotlib
+        matplotlib.use(os.environ.get('MPLBACKEND', 'Agg'))
+
+    import matplotlib.pyplot as plt
+    return plt